@@ -1,6 +1,8 @@
 import os
 import re
+import asyncio
 import logging
+from functools import lru_cache
 from typing import Optional
 from dotenv import load_dotenv
 from telegram import Update
@@ -8,9 +10,14 @@ from telegram.ext import Application, MessageHandler, ContextTypes, filters
 from telegram.constants import ParseMode
 from html import escape as html_escape
 
-from database import Database
-from scheduler import add_reminder_job, remove_reminder_job, setup_scheduler
-from apscheduler.triggers.cron import CronTrigger
+from database import Database, Task
+from scheduler import (
+    add_reminder_job,
+    bump_pending,
+    parse_cron_trigger,
+    remove_reminder_job,
+    setup_scheduler,
+)
 
 # Load environment variables
 load_dotenv()
@@ -25,26 +32,268 @@ logger = logging.getLogger(__name__)
 # Initialize database
 db = Database()
 
-# Regex patterns for commands
-WADD_PATTERN_WITH_USER = re.compile(r"^!wadd\s+(https?://\S+)\s+((?:@\w+\s*)+)$", re.IGNORECASE)
-WADD_PATTERN_NO_USER = re.compile(r"^!wadd\s+(https?://\S+)$", re.IGNORECASE)
-WADD_PREFIX = re.compile(r"^!wadd\b", re.IGNORECASE)
-W_PATTERN = re.compile(r"^!w$", re.IGNORECASE)
-WDONE_PATTERN = re.compile(r"^!wdone\s+(.+)$", re.IGNORECASE)
-WDONE_PREFIX = re.compile(r"^!wdone\b", re.IGNORECASE)
-WHELP_PATTERN = re.compile(r"^!whelp$", re.IGNORECASE)
-WREMINDER_STATUS_PATTERN = re.compile(r"^!wreminder$", re.IGNORECASE)
-WREMINDER_SET_PATTERN = re.compile(r"^!wreminder-set\s+(.+)$", re.IGNORECASE)
-WREMINDER_OFF_PATTERN = re.compile(r"^!wreminder-off$", re.IGNORECASE)
-WREMINDER_REMOVE_PATTERN = re.compile(r"^!wreminder-remove$", re.IGNORECASE)
-WASSIGN_PATTERN = re.compile(r"^!wassign\s+(.+?)\s+((?:@\w+\s*)+)$", re.IGNORECASE)
-WASSIGN_PREFIX = re.compile(r"^!wassign\b", re.IGNORECASE)
-
-# Patterns for extracting task ID from MR/PR URLs
-# GitLab: http://host/group/project/-/merge_requests/123
-GITLAB_MR_PATTERN = re.compile(r"https?://[^/]+/(?:.+?/)*([^/]+)/-/merge_requests/(\d+)")
-# GitHub: https://github.com/owner/repo/pull/123
-GITHUB_PR_PATTERN = re.compile(r"https?://github\.com/[^/]+/([^/]+)/pull/(\d+)")
+# In-process cache of each chat's task list. Populated lazily on first
+# !w per chat and dropped whenever that chat's queue mutates, so
+# repeated listings never touch SQLite.
+_task_cache: dict[int, list[Task]] = {}
+_task_cache_lock = asyncio.Lock()
+
+
+async def _get_cached_tasks(chat_id: int) -> list[Task]:
+    """Return the chat's task list, reading from SQLite only on a miss."""
+    async with _task_cache_lock:
+        tasks = _task_cache.get(chat_id)
+        if tasks is None:
+            tasks = db.get_tasks(chat_id)
+            _task_cache[chat_id] = tasks
+        return tasks
+
+
+def _invalidate_task_cache(chat_id: int) -> None:
+    """Drop the cached task list after a mutation to that chat's queue."""
+    _task_cache.pop(chat_id, None)
+
+# Outgoing reply batcher. Telegram throttles bots to roughly one message
+# per second per chat, so scripted bursts of !wadd/!wdone would have
+# their confirmations serialized. Success confirmations are queued here
+# and flushed as one joined message per chat after a short window; error
+# replies and !w listings stay immediate.
+_OUTBOX_FLUSH_DELAY = 0.3
+_OUTBOX_CHAR_LIMIT = 4096  # Telegram's per-message length cap
+_outbox: dict[int, list[str]] = {}
+_outbox_flushers: dict[int, asyncio.Task] = {}
+
+
+async def _flush_outbox(bot, chat_id: int) -> None:
+    """Send the chat's queued confirmations as one message after the window."""
+    await asyncio.sleep(_OUTBOX_FLUSH_DELAY)
+    lines = _outbox.pop(chat_id, None)
+    _outbox_flushers.pop(chat_id, None)
+    if not lines:
+        return
+    try:
+        # Pack lines into as few messages as possible, splitting on line
+        # boundaries so the length cap never cuts through an HTML tag
+        batch: list[str] = []
+        size = 0
+        for line in lines:
+            if batch and size + len(line) + 1 > _OUTBOX_CHAR_LIMIT:
+                await bot.send_message(
+                    chat_id=chat_id,
+                    text="\n".join(batch),
+                    parse_mode=ParseMode.HTML,
+                    disable_web_page_preview=True
+                )
+                batch = []
+                size = 0
+            batch.append(line)
+            size += len(line) + 1
+        if batch:
+            await bot.send_message(
+                chat_id=chat_id,
+                text="\n".join(batch),
+                parse_mode=ParseMode.HTML,
+                disable_web_page_preview=True
+            )
+    except Exception as e:
+        logger.error("Error flushing replies to chat %s: %s", chat_id, e, exc_info=True)
+
+
+def _enqueue_reply(update: Update, chat_id: int, text: str) -> None:
+    """Queue a success confirmation for batched delivery to the chat."""
+    _outbox.setdefault(chat_id, []).append(text)
+    if chat_id not in _outbox_flushers:
+        _outbox_flushers[chat_id] = asyncio.create_task(
+            _flush_outbox(update.get_bot(), chat_id)
+        )
+
+
+async def _html_reply(update: Update, text: str):
+    """Reply with the handlers' standard HTML kwargs, built in one place."""
+    return await update.message.reply_text(
+        text, parse_mode=ParseMode.HTML, disable_web_page_preview=True
+    )
+
+# Argument patterns, matched against the text *after* the command token.
+# The dispatcher lowercases the token itself, so only the command word is
+# case-insensitive and the patterns stay case-sensitive (no case-folded
+# state tables in the regex engine); URLs and @usernames were never
+# case-folded anyway.
+WADD_ARGS_PATTERN = re.compile(r"^(https?://\S+)(?:\s+((?:@\w+\s*)+))?$")
+WASSIGN_ARGS_PATTERN = re.compile(r"^(.+?)\s+((?:@\w+\s*)+)$")
+
+# Bound method references: calling these skips the .match attribute
+# lookup on every message
+_wadd_args_match = WADD_ARGS_PATTERN.match
+_wassign_args_match = WASSIGN_ARGS_PATTERN.match
+
+# Character sets for the cron shape scan below. Letters are only valid
+# past the minute field, for month/weekday names like jan or mon.
+_CRON_FIRST_FIELD_CHARS = frozenset("0123456789*,-/LW?")
+_CRON_FIELD_CHARS = _CRON_FIRST_FIELD_CHARS | frozenset(
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+)
+
+
+def _cron_is_plausible(s: str) -> bool:
+    """Cheap shape filter for cron expressions: one pass, no allocation.
+
+    Walks the string once, tracking whether we are inside a field and
+    how many fields have closed, and rejects on the first character
+    outside the plausible cron set. Obvious typos never reach the (much
+    more expensive) trigger construction and exception round-trip.
+    """
+    allowed = _CRON_FIRST_FIELD_CHARS
+    fields = 0
+    in_field = False
+    for ch in s:
+        if ch.isspace():
+            if in_field:
+                fields += 1
+                in_field = False
+                allowed = _CRON_FIELD_CHARS
+        elif ch in allowed:
+            in_field = True
+        else:
+            return False
+    if in_field:
+        fields += 1
+    return fields == 5
+
+# Characters that would need HTML escaping; a slug containing any of
+# these is not a real GitHub/GitLab repo and is rejected outright
+_HTML_UNSAFE = frozenset('&<>"\'')
+
+# URL markers used by the linear scan in extract_task_id
+_GITLAB_MR_MARKER = "/-/merge_requests/"
+_GITHUB_PULL_MARKER = "/pull/"
+
+# Accepted URL scheme prefixes, as a tuple so one startswith call
+# covers both
+_HTTP_SCHEMES = ("http://", "https://")
+
+# Static reply texts, built once at import time so the handlers never
+# re-create them per call
+_HELP_TEXT = """<b>Work Queue Commands</b>
+
+<code>!wadd &lt;URL&gt; [@username ...]</code>
+Add a merge request (optionally assign to one or more users)
+Examples:
+• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123</code>
+• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123 @alice</code>
+• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123 @alice @bob</code>
+
+<code>!w</code>
+List all tasks in the queue
+
+<code>!wdone &lt;N or task_id&gt;</code>
+Remove a completed task by number or ID
+Examples: <code>!wdone 1</code>, <code>!wdone #1</code>, or <code>!wdone repo/123</code>
+
+<code>!wassign &lt;N or task_id&gt; @username [...]</code>
+Assign or reassign task (replaces all existing assignees)
+Examples: <code>!wassign 1 @alice</code>, <code>!wassign #2 @bob @charlie</code>, or <code>!wassign repo/45 @alice @bob</code>
+
+<code>!wreminder-set &lt;cron_expression&gt;</code>
+Set automatic reminder (5-part cron format, UTC time)
+Examples:
+• <code>!wreminder-set 0 9 * * *</code> (daily at 9 AM UTC)
+• <code>!wreminder-set 0 9,17 * * 0-4</code> (weekdays at 9 AM & 5 PM)
+
+<code>!wreminder</code>
+Show current reminder configuration
+
+<code>!wreminder-off</code>
+Disable reminder (keeps configuration)
+
+<code>!wreminder-remove</code>
+Delete reminder configuration
+
+<code>!whelp</code>
+Show this help message
+
+<b>Supported URLs:</b>
+• GitLab: <code>http://host/group/project/-/merge_requests/N</code>
+• GitHub: <code>https://github.com/owner/repo/pull/N</code>
+
+<b>Cron Format:</b> <code>* * * * *</code> = minute hour day month day_of_week
+<b>Day of week:</b> 0=Monday, 1=Tuesday, ..., 6=Sunday"""
+
+_ERR_MISSING_URL = (
+    "Missing URL.\n"
+    "Usage: <code>!wadd &lt;URL&gt; [@username ...]</code>\n"
+    "Examples:\n"
+    "• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123</code>\n"
+    "• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123 @alice</code>\n"
+    "• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123 @alice @bob</code>"
+)
+
+_ERR_UNSUPPORTED_URL = (
+    "Unsupported URL format. Must be a GitLab merge request or GitHub pull request.\n"
+    "Supported formats:\n"
+    "• <code>http://host/group/project/-/merge_requests/N</code>\n"
+    "• <code>https://github.com/owner/repo/pull/N</code>"
+)
+
+_ERR_BAD_SCHEME = (
+    "Invalid URL. Must start with http:// or https://\n"
+    "Example: <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123</code>"
+)
+
+_ERR_INVALID_WADD = (
+    "Invalid command format.\n"
+    "Usage: <code>!wadd &lt;URL&gt; [@username ...]</code>"
+)
+
+_ERR_INVALID_MR_URL = (
+    "Invalid URL. Please provide a GitLab merge request or GitHub pull request link.\n"
+    "Examples:\n"
+    "• http://gitlab.example.com/group/repo/-/merge_requests/123\n"
+    "• https://github.com/owner/repo/pull/123"
+)
+
+_WDONE_USAGE = (
+    "Usage: <code>!wdone &lt;N or task_id&gt;</code>\n"
+    "Examples: <code>!wdone 1</code>, <code>!wdone #1</code>, or <code>!wdone repo/123</code>"
+)
+
+_WASSIGN_USAGE = (
+    "Usage: <code>!wassign &lt;N or task_id&gt; @username [...]</code>\n"
+    "Examples:\n"
+    "• <code>!wassign 1 @alice</code>\n"
+    "• <code>!wassign #1 @alice @bob</code>\n"
+    "• <code>!wassign repo/123 @alice @bob @charlie</code>"
+)
+
+_CRON_FORMAT_HELP = (
+    "❌ Invalid cron expression. Must have 5 parts: minute hour day month day_of_week\n\n"
+    "<b>Format:</b> <code>* * * * *</code>\n"
+    "         ↓ ↓ ↓ ↓ ↓\n"
+    "         │ │ │ │ └─ Day of week (0-6, 0=Mon, 6=Sun)\n"
+    "         │ │ │ └─── Month (1-12)\n"
+    "         │ │ └───── Day (1-31)\n"
+    "         │ └─────── Hour (0-23)\n"
+    "         └───────── Minute (0-59)\n\n"
+    "<b>Examples:</b>\n"
+    "• <code>0 9 * * *</code> - Daily at 9 AM UTC\n"
+    "• <code>0 9,17 * * *</code> - Daily at 9 AM & 5 PM UTC\n"
+    "• <code>0 9 * * 0-4</code> - Weekdays at 9 AM UTC\n"
+    "• <code>0 */4 * * *</code> - Every 4 hours"
+)
+
+
+@lru_cache(maxsize=4096)
+def _format_user(user_id: int, username: str | None, first_name: str | None) -> str:
+    """Format the display name for a message author, memoized per user.
+
+    The same users post repeatedly in a busy chat; keying on the id plus
+    the name fields keeps the cache correct if a user renames.
+    """
+    if username:
+        return f"@{username}"
+    if first_name:
+        return first_name
+    return "Unknown"
 
 
 def parse_assignees(assignees_str: str) -> list[str]:
@@ -62,87 +311,108 @@ def parse_assignees(assignees_str: str) -> list[str]:
     return [f"@{mention}" for mention in mentions]
 
 
-def validate_wadd_args(text: str) -> str:
-    """Validate !wadd arguments and return specific error message."""
-    parts = text.split(None, 2)  # Split into max 3 parts: !wadd, url, @user(s) (optional)
-    
+def validate_wadd_args(parts: list[str]) -> str:
+    """Validate already-split !wadd arguments and return specific error message.
+
+    `parts` is the command text split into at most 3 tokens: !wadd, url,
+    @user(s) (optional). The caller splits once so this error path never
+    re-tokenizes the message.
+    """
     if len(parts) == 1:
         # Just "!wadd" with no arguments
-        return (
-            "Missing URL.\n"
-            "Usage: <code>!wadd &lt;URL&gt; [@username ...]</code>\n"
-            "Examples:\n"
-            "• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123</code>\n"
-            "• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123 @alice</code>\n"
-            "• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123 @alice @bob</code>"
-        )
-    
+        return _ERR_MISSING_URL
+
     if len(parts) == 2:
         arg = parts[1]
         if arg.startswith("@"):
             return "Missing URL. Provide a GitLab MR or GitHub PR link before the username(s)."
-        elif arg.startswith("http://") or arg.startswith("https://"):
-            # URL only is valid, but check if it matches GitLab/GitHub pattern
-            if not GITLAB_MR_PATTERN.match(arg) and not GITHUB_PR_PATTERN.match(arg):
-                return (
-                    "Unsupported URL format. Must be a GitLab merge request or GitHub pull request.\n"
-                    "Supported formats:\n"
-                    "• <code>http://host/group/project/-/merge_requests/N</code>\n"
-                    "• <code>https://github.com/owner/repo/pull/N</code>"
-                )
+        elif arg.startswith(_HTTP_SCHEMES):
+            # URL only is valid, but check if it has a GitLab/GitHub shape
+            if extract_task_id(arg) is None:
+                return _ERR_UNSUPPORTED_URL
             # Valid URL, no assignee - this is fine, shouldn't reach here though
             return ""
         else:
-            return (
-                "Invalid URL. Must start with http:// or https://\n"
-                "Example: <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123</code>"
-            )
-    
+            return _ERR_BAD_SCHEME
+
     # len(parts) >= 3, but pattern didn't match
     url_part = parts[1]
     user_part = parts[2]
-    
-    if not (url_part.startswith("http://") or url_part.startswith("https://")):
+
+    if not url_part.startswith(_HTTP_SCHEMES):
         return "Invalid URL. Must start with http:// or https://"
-    
+
     # Check if user_part contains at least one @username
     if not re.search(r'@\w+', user_part):
         return f"Invalid username format. Use <code>@username</code> for each assignee (got: {html_escape(user_part)})"
-    
-    # URL looks valid but doesn't match GitLab/GitHub pattern
-    if not GITLAB_MR_PATTERN.match(url_part) and not GITHUB_PR_PATTERN.match(url_part):
-        return (
-            "Unsupported URL format. Must be a GitLab merge request or GitHub pull request.\n"
-            "Supported formats:\n"
-            "• <code>http://host/group/project/-/merge_requests/N</code>\n"
-            "• <code>https://github.com/owner/repo/pull/N</code>"
-        )
-    
-    return (
-        "Invalid command format.\n"
-        "Usage: <code>!wadd &lt;URL&gt; [@username ...]</code>"
-    )
 
+    # URL looks valid but doesn't have a GitLab/GitHub shape
+    if extract_task_id(url_part) is None:
+        return _ERR_UNSUPPORTED_URL
 
+    return _ERR_INVALID_WADD
+
+
+def _leading_digits(s: str, start: int) -> str:
+    """Return the run of digits in s beginning at start (may be empty)."""
+    i = start
+    n = len(s)
+    while i < n and s[i].isdigit():
+        i += 1
+    return s[start:i]
+
+
+@lru_cache(maxsize=1024)
 def extract_task_id(url: str) -> str | None:
     """Extract task ID from a GitLab MR or GitHub PR URL.
-    
+
     Returns format: repo/N
+
+    Uses a single linear scan plus slicing instead of backtracking
+    regexes, so parsing stays O(n) even on pathological URLs. Results
+    are memoized (URLs are treated as opaque keys), so re-pasting the
+    same MR link costs a dict lookup.
+
+    Invariant: the returned ID is a repo slug plus a digit run, and is
+    safe to embed in HTML replies without escaping. GitHub and GitLab
+    never allow <, >, & or quotes in repo slugs, but raw URL paths can
+    carry them, so slugs containing any of those are rejected here
+    rather than trusted.
     """
-    # Try GitLab pattern
-    gitlab_match = GITLAB_MR_PATTERN.match(url)
-    if gitlab_match:
-        repo = gitlab_match.group(1)
-        mr_number = gitlab_match.group(2)
-        return f"{repo}/{mr_number}"
-    
-    # Try GitHub pattern
-    github_match = GITHUB_PR_PATTERN.match(url)
-    if github_match:
-        repo = github_match.group(1)
-        pr_number = github_match.group(2)
-        return f"{repo}/{pr_number}"
-    
+    if url.startswith("https://"):
+        host_start = 8
+    elif url.startswith("http://"):
+        host_start = 7
+    else:
+        return None
+
+    # GitLab: http://host/group/project/-/merge_requests/123
+    idx = url.find(_GITLAB_MR_MARKER)
+    if idx != -1:
+        number = _leading_digits(url, idx + len(_GITLAB_MR_MARKER))
+        host_end = url.find("/", host_start)
+        repo_start = url.rfind("/", 0, idx) + 1
+        # The repo must be a non-empty path segment after the host
+        if number and host_end != -1 and host_end < repo_start <= idx - 1:
+            repo = url[repo_start:idx]
+            if _HTML_UNSAFE.isdisjoint(repo):
+                return f"{repo}/{number}"
+        return None
+
+    # GitHub: https://github.com/owner/repo/pull/123
+    if url.startswith("github.com/", host_start):
+        owner_start = host_start + len("github.com/")
+        idx = url.find(_GITHUB_PULL_MARKER, owner_start)
+        if idx != -1:
+            number = _leading_digits(url, idx + len(_GITHUB_PULL_MARKER))
+            repo_start = url.rfind("/", owner_start, idx) + 1
+            owner = url[owner_start:repo_start - 1]
+            # Exactly owner/repo between the host and /pull/
+            if number and owner and owner_start < repo_start <= idx - 1 and "/" not in owner:
+                repo = url[repo_start:idx]
+                if _HTML_UNSAFE.isdisjoint(repo):
+                    return f"{repo}/{number}"
+
     return None
 
 
@@ -151,216 +421,212 @@ async def handle_message(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
     if not update.message or not update.message.text:
         return
     
-    text = update.message.text.strip()
-    chat_id = update.effective_chat.id
-    
-    # Get the username of the message author
-    user = update.effective_user
-    created_by = f"@{user.username}" if user and user.username else user.first_name if user else "Unknown"
-    
-    # Check for !wadd command
-    wadd_match_with_user = WADD_PATTERN_WITH_USER.match(text)
-    wadd_match_no_user = WADD_PATTERN_NO_USER.match(text)
-    
-    if wadd_match_with_user:
-        url = wadd_match_with_user.group(1)
-        assignees_str = wadd_match_with_user.group(2)
-        assignees = parse_assignees(assignees_str)
-        await handle_wadd(update, chat_id, url, assignees, created_by)
+    # Cheap gate: almost all messages are ordinary chatter, so probe for
+    # the leading ! by index instead of allocating a stripped copy
+    raw = update.message.text
+    i = 0
+    n = len(raw)
+    while i < n and raw[i].isspace():
+        i += 1
+    if i >= n or raw[i] != "!":
         return
-    elif wadd_match_no_user:
-        url = wadd_match_no_user.group(1)
-        await handle_wadd(update, chat_id, url, [], created_by)
+    text = raw[i:].rstrip()
+
+    # Lowercase the command token once and resolve the handler with a
+    # single dict probe; unknown tokens fall out immediately
+    parts = text.split(None, 1)
+    dispatch = _HANDLERS.get(parts[0].lower())
+    if dispatch is None:
         return
-    elif WADD_PREFIX.match(text):
-        error_msg = validate_wadd_args(text)
-        await update.message.reply_text(error_msg, parse_mode=ParseMode.HTML)
+    rest = parts[1] if len(parts) == 2 else ""
+
+    chat_id = update.effective_chat.id
+
+    await dispatch(update, context, chat_id, rest)
+
+
+async def _dispatch_wadd(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    wadd_match = _wadd_args_match(rest)
+    if wadd_match:
+        url = wadd_match.group(1)
+        assignees_str = wadd_match.group(2)
+        assignees = parse_assignees(assignees_str) if assignees_str else []
+        # Only !wadd records an author, so the effective_user chain and
+        # name formatting run solely on this branch
+        user = update.effective_user
+        created_by = _format_user(user.id, user.username, user.first_name) if user else "Unknown"
+        await handle_wadd(update, chat_id, url, assignees, created_by)
         return
-    
-    # Check for !w command
-    if W_PATTERN.match(text):
+    error_msg = validate_wadd_args(["!wadd"] + rest.split(None, 1))
+    await _html_reply(update, error_msg)
+
+
+async def _dispatch_w(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    if not rest:
         await handle_w(update, chat_id)
+
+
+async def _dispatch_wdone(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    if rest:
+        await handle_wdone(update, chat_id, rest)
         return
-    
-    # Check for !wdone command
-    wdone_match = WDONE_PATTERN.match(text)
-    if wdone_match:
-        task_id = wdone_match.group(1).strip()
-        await handle_wdone(update, chat_id, task_id)
-        return
-    elif WDONE_PREFIX.match(text):
-        await update.message.reply_text(
-            "Usage: <code>!wdone &lt;N or task_id&gt;</code>\n"
-            "Examples: <code>!wdone 1</code>, <code>!wdone #1</code>, or <code>!wdone repo/123</code>",
-            parse_mode=ParseMode.HTML
-        )
-        return
-    
-    # Check for !whelp command
-    if WHELP_PATTERN.match(text):
+    await _html_reply(update, _WDONE_USAGE)
+
+
+async def _dispatch_whelp(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    if not rest:
         await handle_whelp(update)
-        return
-    
-    # Check for !wreminder command
-    if WREMINDER_STATUS_PATTERN.match(text):
+
+
+async def _dispatch_wreminder_status(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    if not rest:
         await handle_wreminder_status(update, chat_id)
-        return
-    
-    # Check for !wreminder-set command
-    wreminder_set_match = WREMINDER_SET_PATTERN.match(text)
-    if wreminder_set_match:
-        cron_expression = wreminder_set_match.group(1).strip()
-        await handle_wreminder_set(update, context, chat_id, cron_expression)
-        return
-    
-    # Check for !wreminder-off command
-    if WREMINDER_OFF_PATTERN.match(text):
+
+
+async def _dispatch_wreminder_set(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    if rest:
+        await handle_wreminder_set(update, context, chat_id, rest)
+
+
+async def _dispatch_wreminder_off(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    if not rest:
         await handle_wreminder_off(update, chat_id)
-        return
-    
-    # Check for !wreminder-remove command
-    if WREMINDER_REMOVE_PATTERN.match(text):
+
+
+async def _dispatch_wreminder_remove(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    if not rest:
         await handle_wreminder_remove(update, chat_id)
-        return
-    
-    # Check for !wassign command
-    wassign_match = WASSIGN_PATTERN.match(text)
+
+
+async def _dispatch_wassign(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, rest: str) -> None:
+    wassign_match = _wassign_args_match(rest)
     if wassign_match:
-        task_ref = wassign_match.group(1).strip()
+        # rest arrives with surrounding whitespace already removed and the
+        # lazy group can't end before the \s+ separator, so the captured
+        # task ref never needs another strip
+        task_ref = wassign_match.group(1)
         assignees_str = wassign_match.group(2)
         assignees = parse_assignees(assignees_str)
         await handle_wassign(update, chat_id, task_ref, assignees)
         return
-    elif WASSIGN_PREFIX.match(text):
-        await update.message.reply_text(
-            "Usage: <code>!wassign &lt;N or task_id&gt; @username [...]</code>\n"
-            "Examples:\n"
-            "• <code>!wassign 1 @alice</code>\n"
-            "• <code>!wassign #1 @alice @bob</code>\n"
-            "• <code>!wassign repo/123 @alice @bob @charlie</code>",
-            parse_mode=ParseMode.HTML
-        )
-        return
+    await _html_reply(update, _WASSIGN_USAGE)
+
+
+# Command token -> dispatcher; one O(1) hash probe classifies a message
+_HANDLERS = {
+    "!wadd": _dispatch_wadd,
+    "!w": _dispatch_w,
+    "!wdone": _dispatch_wdone,
+    "!whelp": _dispatch_whelp,
+    "!wreminder": _dispatch_wreminder_status,
+    "!wreminder-set": _dispatch_wreminder_set,
+    "!wreminder-off": _dispatch_wreminder_off,
+    "!wreminder-remove": _dispatch_wreminder_remove,
+    "!wassign": _dispatch_wassign,
+}
 
 
 async def handle_wadd(update: Update, chat_id: int, url: str, assignees: list[str], created_by: str) -> None:
     """Handle !wadd command - add a new task from MR/PR link."""
+    # Bind the attribute chain once; this handler may run many times per
+    # second under load
+    reply = update.message.reply_text
+
     task_id = extract_task_id(url)
-    
+
     if task_id is None:
-        await update.message.reply_text(
-            "Invalid URL. Please provide a GitLab merge request or GitHub pull request link.\n"
-            "Examples:\n"
-            "• http://gitlab.example.com/group/repo/-/merge_requests/123\n"
-            "• https://github.com/owner/repo/pull/123"
-        )
+        await reply(_ERR_INVALID_MR_URL)
         return
-    
+
     seq_num = db.add_task(chat_id, task_id, url, assignees, created_by)
-    
+
     if seq_num is None:
-        await update.message.reply_text(f"Task {task_id} already exists in the queue.")
+        await reply(f"Task {task_id} already exists in the queue.")
         return
-    
+
+    _invalidate_task_cache(chat_id)
+    bump_pending(chat_id, 1)
+
+    # task_id is HTML-safe by construction (see extract_task_id); only
+    # the raw URL and usernames need escaping
     if assignees:
         assignees_formatted = ", ".join(html_escape(a) for a in assignees)
-        response = f'[#{seq_num}] <a href="{html_escape(url)}">{html_escape(task_id)}</a> → {assignees_formatted}'
+        response = f'[#{seq_num}] <a href="{html_escape(url)}">{task_id}</a> → {assignees_formatted}'
     else:
-        response = f'[#{seq_num}] <a href="{html_escape(url)}">{html_escape(task_id)}</a>'
-    await update.message.reply_text(response, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
+        response = f'[#{seq_num}] <a href="{html_escape(url)}">{task_id}</a>'
+    _enqueue_reply(update, chat_id, response)
     
     assignees_log = ", ".join(assignees) if assignees else "unassigned"
-    logger.info(f"Added task {task_id} in chat {chat_id}: {url} -> {assignees_log}")
+    logger.info("Added task %s in chat %s: %s -> %s", task_id, chat_id, url, assignees_log)
+
+
+def _format_task_line(t) -> str:
+    """Format one task as an HTML line for the !w listing.
+
+    Module-level (rather than a closure in handle_w) so no function
+    object is created per call. Uses the *_html fields pre-escaped at
+    Task construction, so rendering does no escaping at all.
+    """
+    # Explicit join of constant HTML fragments and pre-escaped fields:
+    # no per-field __format__ dispatch, one output buffer
+    if t.assignees:
+        return "".join((
+            '[#', str(t.seq_num), '] <a href="', t.url_html, '">', t.task_id_html,
+            '</a> → ', t.assignees_html, ' (by ', t.created_by_html, ')',
+        ))
+    return "".join((
+        '[#', str(t.seq_num), '] <a href="', t.url_html, '">', t.task_id_html,
+        '</a> (by ', t.created_by_html, ')',
+    ))
 
 
 async def handle_w(update: Update, chat_id: int) -> None:
     """Handle !w command - list all tasks."""
-    tasks = db.get_tasks(chat_id)
-    
+    # Bind the attribute chain once; this handler may run many times per
+    # second under load
+    reply = update.message.reply_text
+
+    tasks = await _get_cached_tasks(chat_id)
+
     if not tasks:
-        await update.message.reply_text("No tasks in the queue.")
+        await reply("No tasks in the queue.")
         return
-    
-    lines = []
-    for t in tasks:
-        if t.assignees:
-            assignees_formatted = ", ".join(html_escape(a) for a in t.assignees)
-            lines.append(f'[#{t.seq_num}] <a href="{html_escape(t.url)}">{html_escape(t.task_id)}</a> → {assignees_formatted} (by {html_escape(t.created_by)})')
-        else:
-            lines.append(f'[#{t.seq_num}] <a href="{html_escape(t.url)}">{html_escape(t.task_id)}</a> (by {html_escape(t.created_by)})')
-    
-    response = "\n".join(lines)
-    await update.message.reply_text(response, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
+
+    # Feed a generator straight to join: no intermediate list, and join
+    # sizes the result buffer once
+    response = "\n".join(_format_task_line(t) for t in tasks)
+    await _html_reply(update, response)
 
 
 async def handle_wdone(update: Update, chat_id: int, task_ref: str) -> None:
     """Handle !wdone command - remove a task by sequence number or task_id."""
     # Strip # prefix if present
     task_ref_clean = task_ref.lstrip('#')
-    
-    # Try to parse as sequence number first
-    if task_ref_clean.isdigit():
-        removed_task = db.remove_task_by_seq(chat_id, int(task_ref_clean))
-    else:
+
+    # Try to parse as sequence number first; one int() pass instead of
+    # isdigit() + int() scanning the string twice
+    try:
+        seq_num = int(task_ref_clean)
+    except ValueError:
         removed_task = db.remove_task_by_id(chat_id, task_ref)
+    else:
+        removed_task = db.remove_task_by_seq(chat_id, seq_num)
     
     if removed_task is None:
         await update.message.reply_text(f"Task {task_ref} not found.")
         return
-    
-    response = f'Removed [#{removed_task.seq_num}] <a href="{html_escape(removed_task.url)}">{html_escape(removed_task.task_id)}</a> (added by {html_escape(removed_task.created_by)})'
-    await update.message.reply_text(response, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
-    logger.info(f"Removed task #{removed_task.seq_num} ({removed_task.task_id}) from chat {chat_id}")
-
-
-async def handle_whelp(update: Update) -> None:
-    """Handle !whelp command - display help instructions."""
-    help_text = """<b>Work Queue Commands</b>
-
-<code>!wadd &lt;URL&gt; [@username ...]</code>
-Add a merge request (optionally assign to one or more users)
-Examples:
-• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123</code>
-• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123 @alice</code>
-• <code>!wadd http://gitlab.example.com/group/repo/-/merge_requests/123 @alice @bob</code>
-
-<code>!w</code>
-List all tasks in the queue
-
-<code>!wdone &lt;N or task_id&gt;</code>
-Remove a completed task by number or ID
-Examples: <code>!wdone 1</code>, <code>!wdone #1</code>, or <code>!wdone repo/123</code>
-
-<code>!wassign &lt;N or task_id&gt; @username [...]</code>
-Assign or reassign task (replaces all existing assignees)
-Examples: <code>!wassign 1 @alice</code>, <code>!wassign #2 @bob @charlie</code>, or <code>!wassign repo/45 @alice @bob</code>
 
-<code>!wreminder-set &lt;cron_expression&gt;</code>
-Set automatic reminder (5-part cron format, UTC time)
-Examples:
-• <code>!wreminder-set 0 9 * * *</code> (daily at 9 AM UTC)
-• <code>!wreminder-set 0 9,17 * * 0-4</code> (weekdays at 9 AM & 5 PM)
+    _invalidate_task_cache(chat_id)
+    bump_pending(chat_id, -1)
 
-<code>!wreminder</code>
-Show current reminder configuration
+    response = f'Removed [#{removed_task.seq_num}] <a href="{removed_task.url_html}">{removed_task.task_id_html}</a> (added by {removed_task.created_by_html})'
+    _enqueue_reply(update, chat_id, response)
+    logger.info("Removed task #%s (%s) from chat %s", removed_task.seq_num, removed_task.task_id, chat_id)
 
-<code>!wreminder-off</code>
-Disable reminder (keeps configuration)
 
-<code>!wreminder-remove</code>
-Delete reminder configuration
-
-<code>!whelp</code>
-Show this help message
-
-<b>Supported URLs:</b>
-• GitLab: <code>http://host/group/project/-/merge_requests/N</code>
-• GitHub: <code>https://github.com/owner/repo/pull/N</code>
-
-<b>Cron Format:</b> <code>* * * * *</code> = minute hour day month day_of_week
-<b>Day of week:</b> 0=Monday, 1=Tuesday, ..., 6=Sunday"""
-    
-    await update.message.reply_text(help_text, parse_mode=ParseMode.HTML)
+async def handle_whelp(update: Update) -> None:
+    """Handle !whelp command - display help instructions."""
+    await _html_reply(update, _HELP_TEXT)
 
 
 async def handle_wreminder_status(update: Update, chat_id: int) -> None:
@@ -368,11 +634,11 @@ async def handle_wreminder_status(update: Update, chat_id: int) -> None:
     reminder = db.get_reminder(chat_id)
     
     if reminder is None:
-        await update.message.reply_text(
+        await _html_reply(
+            update,
             "No reminder configured for this chat.\n\n"
             "Use <code>!wreminder-set &lt;cron_expression&gt;</code> to set one.\n"
-            "Example: <code>!wreminder-set 0 9 * * *</code> (daily at 9 AM UTC)",
-            parse_mode=ParseMode.HTML
+            "Example: <code>!wreminder-set 0 9 * * *</code> (daily at 9 AM UTC)"
         )
         return
     
@@ -387,49 +653,40 @@ Updated: {reminder.updated_at}
 
 Use <code>!wreminder-off</code> to disable or <code>!wreminder-remove</code> to delete."""
     
-    await update.message.reply_text(response, parse_mode=ParseMode.HTML)
+    await _html_reply(update, response)
 
 
 async def handle_wreminder_set(update: Update, context: ContextTypes.DEFAULT_TYPE, chat_id: int, cron_expression: str) -> None:
     """Handle !wreminder-set command - set or update reminder schedule."""
-    # Validate cron expression
+    # Validate cron expression. No maxsplit: a bounded split would fold
+    # extra fields into the last part and let 6-field expressions through,
+    # and Telegram already caps input at 4096 chars
     parts = cron_expression.split()
     if len(parts) != 5:
-        await update.message.reply_text(
-            "❌ Invalid cron expression. Must have 5 parts: minute hour day month day_of_week\n\n"
-            "<b>Format:</b> <code>* * * * *</code>\n"
-            "         ↓ ↓ ↓ ↓ ↓\n"
-            "         │ │ │ │ └─ Day of week (0-6, 0=Mon, 6=Sun)\n"
-            "         │ │ │ └─── Month (1-12)\n"
-            "         │ │ └───── Day (1-31)\n"
-            "         │ └─────── Hour (0-23)\n"
-            "         └───────── Minute (0-59)\n\n"
-            "<b>Examples:</b>\n"
-            "• <code>0 9 * * *</code> - Daily at 9 AM UTC\n"
-            "• <code>0 9,17 * * *</code> - Daily at 9 AM & 5 PM UTC\n"
-            "• <code>0 9 * * 0-4</code> - Weekdays at 9 AM UTC\n"
-            "• <code>0 */4 * * *</code> - Every 4 hours",
-            parse_mode=ParseMode.HTML
+        await _html_reply(update, _CRON_FORMAT_HELP)
+        return
+
+    # Reject obviously invalid characters before the (much more
+    # expensive) trigger construction and exception round-trip
+    if not _cron_is_plausible(cron_expression):
+        await _html_reply(
+            update,
+            "❌ Invalid cron expression: unsupported characters.\n\n"
+            "Please check your expression and try again.\n"
+            "Example: <code>!wreminder-set 0 9 * * *</code>"
         )
         return
-    
-    # Try to validate with APScheduler
+
+    # Try to validate with APScheduler; the parsed trigger is cached so
+    # add_reminder_job below won't re-parse the same expression
     try:
-        minute, hour, day, month, day_of_week = parts
-        CronTrigger(
-            minute=minute,
-            hour=hour,
-            day=day,
-            month=month,
-            day_of_week=day_of_week,
-            timezone='UTC'
-        )
+        parse_cron_trigger(cron_expression)
     except Exception as e:
-        await update.message.reply_text(
+        await _html_reply(
+            update,
             f"❌ Invalid cron expression: {html_escape(str(e))}\n\n"
             "Please check your expression and try again.\n"
-            "Example: <code>!wreminder-set 0 9 * * *</code>",
-            parse_mode=ParseMode.HTML
+            "Example: <code>!wreminder-set 0 9 * * *</code>"
         )
         return
     
@@ -441,21 +698,21 @@ async def handle_wreminder_set(update: Update, context: ContextTypes.DEFAULT_TYP
         # Get the application from the context
         add_reminder_job(chat_id, cron_expression, context.application, db)
         
-        await update.message.reply_text(
+        await _html_reply(
+            update,
             f"✅ Reminder set successfully!\n\n"
             f"Schedule: <code>{html_escape(cron_expression)}</code>\n"
             f"Timezone: UTC\n\n"
             f"You'll receive reminders when there are pending tasks.\n"
-            f"Use <code>!wreminder</code> to check status.",
-            parse_mode=ParseMode.HTML
+            f"Use <code>!wreminder</code> to check status."
         )
-        logger.info(f"Set reminder for chat {chat_id}: {cron_expression}")
+        logger.info("Set reminder for chat %s: %s", chat_id, cron_expression)
         
     except Exception as e:
-        logger.error(f"Error setting reminder for chat {chat_id}: {e}", exc_info=True)
-        await update.message.reply_text(
-            "❌ Error setting reminder. Please try again later.",
-            parse_mode=ParseMode.HTML
+        logger.error("Error setting reminder for chat %s: %s", chat_id, e, exc_info=True)
+        await _html_reply(
+            update,
+            "❌ Error setting reminder. Please try again later."
         )
 
 
@@ -464,22 +721,22 @@ async def handle_wreminder_off(update: Update, chat_id: int) -> None:
     success = db.disable_reminder(chat_id)
     
     if not success:
-        await update.message.reply_text(
+        await _html_reply(
+            update,
             "No reminder configured for this chat.\n"
-            "Use <code>!wreminder-set &lt;cron_expression&gt;</code> to set one.",
-            parse_mode=ParseMode.HTML
+            "Use <code>!wreminder-set &lt;cron_expression&gt;</code> to set one."
         )
         return
     
     # Remove from scheduler
     remove_reminder_job(chat_id)
     
-    await update.message.reply_text(
+    await _html_reply(
+        update,
         "⏸ Reminder disabled.\n\n"
-        "Your configuration is saved. Use <code>!wreminder-set &lt;cron_expression&gt;</code> to re-enable.",
-        parse_mode=ParseMode.HTML
+        "Your configuration is saved. Use <code>!wreminder-set &lt;cron_expression&gt;</code> to re-enable."
     )
-    logger.info(f"Disabled reminder for chat {chat_id}")
+    logger.info("Disabled reminder for chat %s", chat_id)
 
 
 async def handle_wreminder_remove(update: Update, chat_id: int) -> None:
@@ -487,48 +744,55 @@ async def handle_wreminder_remove(update: Update, chat_id: int) -> None:
     success = db.delete_reminder(chat_id)
     
     if not success:
-        await update.message.reply_text(
-            "No reminder configured for this chat.",
-            parse_mode=ParseMode.HTML
+        await _html_reply(
+            update,
+            "No reminder configured for this chat."
         )
         return
     
     # Remove from scheduler
     remove_reminder_job(chat_id)
     
-    await update.message.reply_text(
+    await _html_reply(
+        update,
         "🗑 Reminder configuration deleted.\n\n"
-        "Use <code>!wreminder-set &lt;cron_expression&gt;</code> to create a new one.",
-        parse_mode=ParseMode.HTML
+        "Use <code>!wreminder-set &lt;cron_expression&gt;</code> to create a new one."
     )
-    logger.info(f"Removed reminder for chat {chat_id}")
+    logger.info("Removed reminder for chat %s", chat_id)
 
 
 async def handle_wassign(update: Update, chat_id: int, task_ref: str, assignees: list[str]) -> None:
     """Handle !wassign command - assign or reassign a task to one or more users."""
     # Strip # prefix if present
     task_ref_clean = task_ref.lstrip('#')
-    
-    # Try to parse as sequence number first
-    if task_ref_clean.isdigit():
-        updated_task = db.update_task_assignees_by_seq(chat_id, int(task_ref_clean), assignees)
-    else:
+
+    # Try to parse as sequence number first; one int() pass instead of
+    # isdigit() + int() scanning the string twice
+    try:
+        seq_num = int(task_ref_clean)
+    except ValueError:
         updated_task = db.update_task_assignees_by_id(chat_id, task_ref, assignees)
+    else:
+        updated_task = db.update_task_assignees_by_seq(chat_id, seq_num, assignees)
     
     if updated_task is None:
         await update.message.reply_text(f"Task {task_ref} not found.")
         return
-    
+
+    _invalidate_task_cache(chat_id)
+
     if assignees:
+        # Escape the assignees from the command itself so the reply
+        # preserves the order they were given in
         assignees_formatted = ", ".join(html_escape(a) for a in assignees)
-        response = f'[#{updated_task.seq_num}] <a href="{html_escape(updated_task.url)}">{html_escape(updated_task.task_id)}</a> → {assignees_formatted}'
+        response = f'[#{updated_task.seq_num}] <a href="{updated_task.url_html}">{updated_task.task_id_html}</a> → {assignees_formatted}'
     else:
-        response = f'[#{updated_task.seq_num}] <a href="{html_escape(updated_task.url)}">{html_escape(updated_task.task_id)}</a> (unassigned)'
-    
-    await update.message.reply_text(response, parse_mode=ParseMode.HTML, disable_web_page_preview=True)
+        response = f'[#{updated_task.seq_num}] <a href="{updated_task.url_html}">{updated_task.task_id_html}</a> (unassigned)'
+
+    _enqueue_reply(update, chat_id, response)
     
     assignees_log = ", ".join(assignees) if assignees else "unassigned"
-    logger.info(f"Assigned task #{updated_task.seq_num} ({updated_task.task_id}) to {assignees_log} in chat {chat_id}")
+    logger.info("Assigned task #%s (%s) to %s in chat %s", updated_task.seq_num, updated_task.task_id, assignees_log, chat_id)
 
 
 def main() -> None:
@@ -539,8 +803,9 @@ def main() -> None:
         logger.error("TELEGRAM_BOT_TOKEN not set in environment variables")
         raise ValueError("TELEGRAM_BOT_TOKEN environment variable is required")
     
-    # Create application
-    application = Application.builder().token(token).build()
+    # Create application. concurrent_updates lets handlers overlap their
+    # Telegram API round-trips instead of processing updates one at a time
+    application = Application.builder().token(token).concurrent_updates(True).build()
     
     # Add message handler for all text messages
     application.add_handler(
@@ -1,15 +1,136 @@
 import os
+import queue
 import sqlite3
+import threading
+from contextlib import contextmanager
 from typing import Optional
-from dataclasses import dataclass
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+# Single-pass HTML escape; html.escape does three sequential str.replace
+# scans, str.translate does one.
+_HTML_TRANS = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+
+def _esc(s: str) -> str:
+    return s.translate(_HTML_TRANS)
+
 
 # Use /app/data in Docker, current directory otherwise
 DATA_DIR = os.environ.get("DATA_DIR", ".")
 DB_PATH = os.path.join(DATA_DIR, "workqueue.db")
 
+# Read-only connections kept for the query paths; under WAL these run
+# concurrently with the single writer instead of queueing behind it
+_READER_POOL_SIZE = 4
+
+# Tasks and their assignees are fetched in one round-trip instead of
+# one extra SELECT per task: assignees arrive concatenated with the
+# unit separator (char(31), which cannot appear in a @username) and are
+# split back apart in Python. The inner subquery orders by the ord
+# column, so the (task_id, ord) index delivers assignees in the order
+# they were assigned without a sort step.
+_ASSIGNEE_SEP = "\x1f"
+
+_ASSIGNEES_EXPR = """(
+        SELECT GROUP_CONCAT(assignee, char(31))
+        FROM (SELECT assignee FROM task_assignees
+              WHERE task_id = t.id ORDER BY ord)
+    ) AS assignees"""
+
+_TASK_SELECT = """
+    SELECT t.id, t.chat_id, t.seq_num, t.task_id, t.url, t.created_by, t.created_at,
+    """ + _ASSIGNEES_EXPR + """
+    FROM tasks t
+    WHERE t.chat_id = ? AND {key} = ?
+"""
+
+_SQL_TASKS_FOR_CHAT = """
+    SELECT t.id, t.chat_id, t.seq_num, t.task_id, t.url, t.created_by, t.created_at,
+    """ + _ASSIGNEES_EXPR + """
+    FROM tasks t
+    WHERE t.chat_id = ?
+    ORDER BY t.seq_num ASC
+    LIMIT ? OFFSET ?
+"""
+_SQL_TASKS_FOR_CHATS = """
+    SELECT t.id, t.chat_id, t.seq_num, t.task_id, t.url, t.created_by, t.created_at,
+    """ + _ASSIGNEES_EXPR + """
+    FROM tasks t
+    WHERE t.chat_id IN ({placeholders})
+    ORDER BY t.chat_id, t.seq_num ASC
+"""
+_SQL_TASK_BY_SEQ = _TASK_SELECT.format(key="t.seq_num")
+_SQL_TASK_BY_TASK_ID = _TASK_SELECT.format(key="t.task_id")
+
+# Hot statements are module constants: the same SQL text object is
+# handed to execute() every call, so sqlite3's per-connection statement
+# cache always hits and nothing is re-prepared.
+# created_at is set explicitly rather than via the column default:
+# databases created before the unixepoch migration keep their original
+# TEXT CURRENT_TIMESTAMP default, which would reintroduce text rows
+_SQL_INSERT_TASK = """
+    INSERT INTO tasks (chat_id, seq_num, task_id, url, created_by, created_at)
+    VALUES (?, ?, ?, ?, ?, unixepoch())
+"""
+_SQL_NEXT_SEQ_NUM = """
+    INSERT INTO seq_counters (chat_id, next_num) VALUES (?, 2)
+    ON CONFLICT(chat_id) DO UPDATE SET next_num = next_num + 1
+    RETURNING next_num - 1
+"""
+_DELETE_TASK = """
+    DELETE FROM tasks
+    WHERE chat_id = ? AND {key} = ?
+    RETURNING id, chat_id, seq_num, task_id, url, created_by, created_at
+"""
+_SQL_DELETE_TASK_BY_SEQ = _DELETE_TASK.format(key="seq_num")
+_SQL_DELETE_TASK_BY_TASK_ID = _DELETE_TASK.format(key="task_id")
+_DELETE_TASK_ASSIGNEES = """
+    DELETE FROM task_assignees
+    WHERE task_id = (SELECT id FROM tasks WHERE chat_id = ? AND {key} = ?)
+    RETURNING assignee
+"""
+_SQL_DELETE_TASK_ASSIGNEES_BY_SEQ = _DELETE_TASK_ASSIGNEES.format(key="seq_num")
+_SQL_DELETE_TASK_ASSIGNEES_BY_TASK_ID = _DELETE_TASK_ASSIGNEES.format(key="task_id")
+_SQL_DELETE_ASSIGNEES = "DELETE FROM task_assignees WHERE task_id = ?"
+_SQL_INSERT_ASSIGNEE = "INSERT OR IGNORE INTO task_assignees (task_id, assignee, ord) VALUES (?, ?, ?)"
+_SQL_PENDING_COUNTS = """
+    SELECT chat_id, COUNT(*)
+    FROM tasks
+    GROUP BY chat_id
+"""
+
+_SQL_UPSERT_REMINDER = """
+    INSERT INTO reminders (chat_id, cron_expression, enabled, created_at, updated_at)
+    VALUES (?, ?, ?, unixepoch(), unixepoch())
+    ON CONFLICT(chat_id) DO UPDATE SET
+        cron_expression = excluded.cron_expression,
+        enabled = excluded.enabled,
+        updated_at = unixepoch()
+"""
+_SQL_GET_REMINDER = """
+    SELECT chat_id, cron_expression, enabled, created_at, updated_at
+    FROM reminders
+    WHERE chat_id = ?
+"""
+_SQL_GET_ACTIVE_REMINDERS = """
+    SELECT chat_id, cron_expression, enabled, created_at, updated_at
+    FROM reminders
+    WHERE enabled = 1
+"""
+_SQL_DISABLE_REMINDER = "UPDATE reminders SET enabled = 0, updated_at = unixepoch() WHERE chat_id = ?"
+_SQL_DELETE_REMINDER = "DELETE FROM reminders WHERE chat_id = ?"
+
+
+def _from_unix(ts: int) -> datetime:
+    """Convert stored unix seconds to a naive UTC datetime."""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None)
+
 
-@dataclass
+# slots=True turns attribute access on these records into fixed-offset
+# lookups (no per-instance __dict__), which the render loops in bot.py
+# and scheduler.py hit several times per task
+@dataclass(slots=True)
 class Task:
     id: int
     chat_id: int
@@ -19,9 +140,22 @@ class Task:
     assignees: list[str]
     created_by: str
     created_at: datetime
+    # Pre-escaped HTML renderings, computed once at construction so the
+    # !w / reminder render paths don't re-escape the same strings on
+    # every listing
+    url_html: str = field(init=False, repr=False)
+    task_id_html: str = field(init=False, repr=False)
+    created_by_html: str = field(init=False, repr=False)
+    assignees_html: str = field(init=False, repr=False)
 
+    def __post_init__(self) -> None:
+        self.url_html = _esc(self.url)
+        self.task_id_html = _esc(self.task_id)
+        self.created_by_html = _esc(self.created_by)
+        self.assignees_html = ", ".join(_esc(a) for a in self.assignees)
 
-@dataclass
+
+@dataclass(slots=True)
 class Reminder:
     chat_id: int
     cron_expression: str
@@ -35,15 +169,67 @@ class Database:
         self.db_path = db_path
         # Ensure data directory exists
         os.makedirs(os.path.dirname(db_path) or ".", exist_ok=True)
+        # One long-lived connection per process instead of connect/close
+        # around every call: SQLite's page cache survives between calls
+        # and the pragmas below are applied once. check_same_thread is
+        # off because handlers may run on worker threads; _lock
+        # serializes all access to the connection.
+        self._conn = sqlite3.connect(
+            db_path, check_same_thread=False, cached_statements=256
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        for pragma in (
+            "PRAGMA journal_mode=WAL",
+            "PRAGMA synchronous=NORMAL",
+            "PRAGMA temp_store=MEMORY",
+            "PRAGMA cache_size=-64000",
+            "PRAGMA foreign_keys=ON",
+            "PRAGMA mmap_size=268435456",
+        ):
+            self._conn.execute(pragma)
         self._init_db()
+        # The pool is filled after _init_db so the database file exists
+        # before the read-only opens
+        self._readers: queue.Queue[sqlite3.Connection] = queue.Queue()
+        for _ in range(_READER_POOL_SIZE):
+            reader = sqlite3.connect(
+                f"file:{db_path}?mode=ro", uri=True,
+                check_same_thread=False, cached_statements=256
+            )
+            reader.row_factory = sqlite3.Row
+            self._readers.put(reader)
+        # Reminders change rarely but are read on every scheduler tick;
+        # cache them per chat (None means "known absent") and drop the
+        # entries on write, mirroring the task cache in bot.py
+        self._reminder_cache: dict[int, Optional[Reminder]] = {}
+        self._active_reminders_cache: Optional[list[Reminder]] = None
+        self._reminder_cache_lock = threading.Lock()
+
+    def _invalidate_reminder_cache(self, chat_id: int) -> None:
+        """Drop cached reminder state after a write for the chat."""
+        with self._reminder_cache_lock:
+            self._reminder_cache.pop(chat_id, None)
+            self._active_reminders_cache = None
+
+    @contextmanager
+    def _reader(self):
+        """Borrow a read-only connection from the pool."""
+        conn = self._readers.get()
+        try:
+            yield conn
+        finally:
+            self._readers.put(conn)
 
-    def _get_connection(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+    def close(self) -> None:
+        """Close the shared connections (shutdown and tests)."""
+        self._conn.close()
+        while not self._readers.empty():
+            self._readers.get_nowait().close()
 
     def _init_db(self) -> None:
-        with self._get_connection() as conn:
+        conn = self._conn
+        with self._lock, conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS tasks (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -51,9 +237,8 @@ class Database:
                     seq_num INTEGER NOT NULL,
                     task_id TEXT NOT NULL,
                     url TEXT NOT NULL,
-                    assigned_to TEXT NOT NULL,
                     created_by TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    created_at INTEGER NOT NULL DEFAULT (unixepoch()),
                     UNIQUE(chat_id, task_id),
                     UNIQUE(chat_id, seq_num)
                 )
@@ -63,6 +248,7 @@ class Database:
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     task_id INTEGER NOT NULL,
                     assignee TEXT NOT NULL,
+                    ord INTEGER NOT NULL DEFAULT 0,
                     FOREIGN KEY (task_id) REFERENCES tasks(id) ON DELETE CASCADE,
                     UNIQUE(task_id, assignee)
                 )
@@ -78,360 +264,303 @@ class Database:
                     chat_id INTEGER PRIMARY KEY,
                     cron_expression TEXT NOT NULL,
                     enabled BOOLEAN NOT NULL DEFAULT 1,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                    created_at INTEGER NOT NULL DEFAULT (unixepoch()),
+                    updated_at INTEGER NOT NULL DEFAULT (unixepoch())
                 )
             """)
+            # get_all_active_reminders filters on enabled=1; this partial
+            # index answers it without scanning disabled rows. The task
+            # lookups are already covered by the UNIQUE auto-indexes.
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_reminders_enabled
+                ON reminders(chat_id) WHERE enabled = 1
+            """)
             conn.commit()
             
-            # Migrate existing assigned_to data to task_assignees table
-            self._migrate_assignees(conn)
-
-    def _get_next_seq_num(self, conn: sqlite3.Connection, chat_id: int) -> int:
-        cursor = conn.execute(
-            "SELECT next_num FROM seq_counters WHERE chat_id = ?",
-            (chat_id,)
-        )
-        row = cursor.fetchone()
-        
-        if row is None:
-            conn.execute(
-                "INSERT INTO seq_counters (chat_id, next_num) VALUES (?, 2)",
-                (chat_id,)
-            )
-            return 1
-        else:
-            next_num = row["next_num"]
-            conn.execute(
-                "UPDATE seq_counters SET next_num = ? WHERE chat_id = ?",
-                (next_num + 1, chat_id)
-            )
-            return next_num
+            # One-time migrations are gated on the schema version so a
+            # restart pays a single PRAGMA read instead of probing tables
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                # Legacy databases carried a redundant assigned_to column
+                # on tasks; fold its data into task_assignees, then drop
+                # it so every row sheds the duplicate text payload
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(tasks)")}
+                if "assigned_to" in columns:
+                    self._migrate_assignees(conn)
+                    conn.execute("ALTER TABLE tasks DROP COLUMN assigned_to")
+            if version < 2:
+                # ord records assignment order; pre-existing rows keep
+                # the default 0 and fall back to rowid order within a task
+                columns = {row[1] for row in conn.execute("PRAGMA table_info(task_assignees)")}
+                if "ord" not in columns:
+                    conn.execute("ALTER TABLE task_assignees ADD COLUMN ord INTEGER NOT NULL DEFAULT 0")
+            if version < 3:
+                # Timestamps move from ISO-8601 text to integer unix
+                # seconds: smaller rows, no string handling per read
+                conn.execute("""
+                    UPDATE tasks SET created_at = CAST(strftime('%s', created_at) AS INTEGER)
+                    WHERE typeof(created_at) = 'text'
+                """)
+                conn.execute("""
+                    UPDATE reminders SET
+                        created_at = CAST(strftime('%s', created_at) AS INTEGER),
+                        updated_at = CAST(strftime('%s', updated_at) AS INTEGER)
+                    WHERE typeof(created_at) = 'text'
+                """)
+                conn.execute("PRAGMA user_version = 3")
+            # Created after the migrations so the ord column exists on
+            # legacy databases too
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_ta_task_ord
+                ON task_assignees(task_id, ord)
+            """)
 
     def _migrate_assignees(self, conn: sqlite3.Connection) -> None:
-        """Migrate existing assigned_to data to task_assignees table."""
-        # Check if migration is needed (task_assignees is empty)
-        cursor = conn.execute("SELECT COUNT(*) as count FROM task_assignees")
-        if cursor.fetchone()["count"] > 0:
-            return  # Already migrated
-        
-        # Get all tasks with assignees
-        cursor = conn.execute("""
-            SELECT id, assigned_to FROM tasks 
-            WHERE assigned_to != 'unassigned' AND assigned_to != ''
+        """Migrate existing assigned_to data to task_assignees table.
+
+        Only called while user_version < 1; INSERT OR IGNORE keeps it
+        idempotent without probing whether it already ran.
+        """
+        # One set-oriented INSERT ... SELECT instead of materializing
+        # every task row in Python and inserting one at a time; the
+        # enclosing _init_db transaction commits it
+        conn.execute("""
+            INSERT OR IGNORE INTO task_assignees (task_id, assignee)
+            SELECT id, assigned_to FROM tasks
+            WHERE assigned_to NOT IN ('unassigned', '')
         """)
-        
-        for row in cursor.fetchall():
-            task_id = row["id"]
-            assigned_to = row["assigned_to"]
-            
-            # Insert into task_assignees table
-            try:
-                conn.execute(
-                    "INSERT INTO task_assignees (task_id, assignee) VALUES (?, ?)",
-                    (task_id, assigned_to)
-                )
-            except sqlite3.IntegrityError:
-                pass  # Skip duplicates
-        
-        conn.commit()
-
-    def _get_task_assignees(self, conn: sqlite3.Connection, task_id: int) -> list[str]:
-        """Get all assignees for a task."""
-        cursor = conn.execute(
-            "SELECT assignee FROM task_assignees WHERE task_id = ? ORDER BY assignee",
-            (task_id,)
-        )
-        return [row["assignee"] for row in cursor.fetchall()]
 
     def _set_task_assignees(self, conn: sqlite3.Connection, task_id: int, assignees: list[str]) -> None:
         """Replace all assignees for a task."""
         # Delete existing assignees
-        conn.execute("DELETE FROM task_assignees WHERE task_id = ?", (task_id,))
-        
-        # Insert new assignees
-        for assignee in assignees:
-            if assignee:  # Skip empty strings
-                try:
-                    conn.execute(
-                        "INSERT INTO task_assignees (task_id, assignee) VALUES (?, ?)",
-                        (task_id, assignee)
-                    )
-                except sqlite3.IntegrityError:
-                    pass  # Skip duplicates
+        conn.execute(_SQL_DELETE_ASSIGNEES, (task_id,))
+
+        # One executemany instead of a per-assignee execute: empties are
+        # filtered and duplicates collapsed up front (dict.fromkeys keeps
+        # order), INSERT OR IGNORE covers the UNIQUE constraint without
+        # a per-row try/except, and ord preserves assignment order
+        rows = [
+            (task_id, a, i)
+            for i, a in enumerate(dict.fromkeys(a for a in assignees if a))
+        ]
+        if rows:
+            conn.executemany(_SQL_INSERT_ASSIGNEE, rows)
 
     def add_task(self, chat_id: int, task_id: str, url: str, assignees: list[str], created_by: str) -> Optional[int]:
         """Add a task. Returns sequence number if added, None if already exists."""
         try:
-            with self._get_connection() as conn:
-                seq_num = self._get_next_seq_num(conn, chat_id)
-                # Keep assigned_to for backward compatibility (use first assignee or 'unassigned')
-                assigned_to = assignees[0] if assignees else "unassigned"
-                
+            conn = self._conn
+            with self._lock, conn:
+                # Counter UPSERT and task INSERT back to back in the same
+                # transaction (SQLite has no writable CTEs that could
+                # merge them into one statement): the first use of a chat
+                # seeds the counter at 2, later uses bump it, and
+                # RETURNING hands back the number just consumed
+                seq_num = conn.execute(_SQL_NEXT_SEQ_NUM, (chat_id,)).fetchone()[0]
                 cursor = conn.execute(
-                    """
-                    INSERT INTO tasks (chat_id, seq_num, task_id, url, assigned_to, created_by)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                    """,
-                    (chat_id, seq_num, task_id, url, assigned_to, created_by)
+                    _SQL_INSERT_TASK,
+                    (chat_id, seq_num, task_id, url, created_by)
                 )
                 
                 # Get the inserted task id and add assignees
                 task_db_id = cursor.lastrowid
                 self._set_task_assignees(conn, task_db_id, assignees)
                 
-                conn.commit()
                 return seq_num
         except sqlite3.IntegrityError:
             return None
 
-    def get_tasks(self, chat_id: int) -> list[Task]:
-        """Get all tasks for a chat, ordered by sequence number."""
-        with self._get_connection() as conn:
+    def get_tasks(self, chat_id: int, limit: Optional[int] = None, offset: int = 0) -> list[Task]:
+        """Get tasks for a chat, ordered by sequence number.
+
+        limit/offset allow paging long queues; by default the full list
+        is returned (SQLite treats LIMIT -1 as unlimited). Rows stream
+        off the cursor rather than being materialized twice.
+        """
+        with self._reader() as conn:
             cursor = conn.execute(
-                """
-                SELECT id, chat_id, seq_num, task_id, url, assigned_to, created_by, created_at
-                FROM tasks
-                WHERE chat_id = ?
-                ORDER BY seq_num ASC
-                """,
-                (chat_id,)
+                _SQL_TASKS_FOR_CHAT,
+                (chat_id, limit if limit is not None else -1, offset)
             )
-            tasks = []
-            for row in cursor.fetchall():
-                assignees = self._get_task_assignees(conn, row["id"])
-                tasks.append(Task(
-                    id=row["id"],
-                    chat_id=row["chat_id"],
-                    seq_num=row["seq_num"],
-                    task_id=row["task_id"],
-                    url=row["url"],
-                    assignees=assignees,
-                    created_by=row["created_by"],
-                    created_at=row["created_at"]
-                ))
-            return tasks
-
-    def _row_to_task(self, conn: sqlite3.Connection, row: sqlite3.Row) -> Task:
-        assignees = self._get_task_assignees(conn, row["id"])
+            return [self._row_to_task(row) for row in cursor]
+
+    def get_tasks_for_chats(self, chat_ids: list[int]) -> dict[int, list[Task]]:
+        """Get tasks for several chats in one query, keyed by chat id.
+
+        Chats with no tasks map to an empty list, so callers can index
+        without checking membership. Used by the reminder fan-out to
+        avoid one query per chat.
+        """
+        if not chat_ids:
+            return {}
+        sql = _SQL_TASKS_FOR_CHATS.format(placeholders=",".join("?" * len(chat_ids)))
+        tasks_by_chat: dict[int, list[Task]] = {chat_id: [] for chat_id in chat_ids}
+        with self._reader() as conn:
+            for row in conn.execute(sql, chat_ids):
+                tasks_by_chat[row[1]].append(self._row_to_task(row))
+        return tasks_by_chat
+
+    def get_pending_counts(self) -> dict[int, int]:
+        """Count of open tasks per chat; seeds the scheduler's skip cache."""
+        with self._reader() as conn:
+            return {row[0]: row[1] for row in conn.execute(_SQL_PENDING_COUNTS)}
+
+    def _row_to_task(self, row: sqlite3.Row) -> Task:
+        """Build a Task from a JOINed row carrying concatenated assignees.
+
+        Columns are addressed positionally (the SELECT lists fix the
+        order); row[i] skips the per-column name lookup of row["name"],
+        which adds up across a full listing.
+        """
+        joined = row[7]
         return Task(
-            id=row["id"],
-            chat_id=row["chat_id"],
-            seq_num=row["seq_num"],
-            task_id=row["task_id"],
-            url=row["url"],
-            assignees=assignees,
-            created_by=row["created_by"],
-            created_at=row["created_at"]
+            row[0],  # id
+            row[1],  # chat_id
+            row[2],  # seq_num
+            row[3],  # task_id
+            row[4],  # url
+            # Already in assignment order thanks to ORDER BY ord
+            joined.split(_ASSIGNEE_SEP) if joined else [],
+            row[5],  # created_by
+            _from_unix(row[6]),
+        )
+
+
+    def _task_from_row(self, row: sqlite3.Row, assignees: list[str]) -> Task:
+        """Build a Task from a plain tasks row and an in-hand assignee list."""
+        return Task(
+            row[0],  # id
+            row[1],  # chat_id
+            row[2],  # seq_num
+            row[3],  # task_id
+            row[4],  # url
+            # Mirror what a re-read would produce: empties dropped,
+            # duplicates collapsed, assignment order kept
+            list(dict.fromkeys(a for a in assignees if a)),
+            row[5],  # created_by
+            _from_unix(row[6]),
         )
 
     def remove_task_by_id(self, chat_id: int, task_id: str) -> Optional[Task]:
         """Remove a task by its task_id and return the removed task, or None if not found."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT id, chat_id, seq_num, task_id, url, assigned_to, created_by, created_at
-                FROM tasks
-                WHERE chat_id = ? AND task_id = ?
-                """,
-                (chat_id, task_id)
-            )
-            row = cursor.fetchone()
+        conn = self._conn
+        with self._lock, conn:
+            # Fused fetch+delete via RETURNING: the junction delete hands
+            # back the assignees (the FK cascade would otherwise remove
+            # them before a RETURNING subquery could see them), then the
+            # task delete returns the row itself
+            assignees = [r[0] for r in conn.execute(_SQL_DELETE_TASK_ASSIGNEES_BY_TASK_ID, (chat_id, task_id))]
+            row = conn.execute(_SQL_DELETE_TASK_BY_TASK_ID, (chat_id, task_id)).fetchone()
             
             if row is None:
                 return None
             
-            task = self._row_to_task(conn, row)
-            conn.execute(
-                "DELETE FROM tasks WHERE chat_id = ? AND task_id = ?",
-                (chat_id, task_id)
-            )
-            conn.commit()
-            return task
+            return self._task_from_row(row, assignees)
 
     def remove_task_by_seq(self, chat_id: int, seq_num: int) -> Optional[Task]:
         """Remove a task by its sequence number and return the removed task, or None if not found."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT id, chat_id, seq_num, task_id, url, assigned_to, created_by, created_at
-                FROM tasks
-                WHERE chat_id = ? AND seq_num = ?
-                """,
-                (chat_id, seq_num)
-            )
-            row = cursor.fetchone()
+        conn = self._conn
+        with self._lock, conn:
+            assignees = [r[0] for r in conn.execute(_SQL_DELETE_TASK_ASSIGNEES_BY_SEQ, (chat_id, seq_num))]
+            row = conn.execute(_SQL_DELETE_TASK_BY_SEQ, (chat_id, seq_num)).fetchone()
             
             if row is None:
                 return None
             
-            task = self._row_to_task(conn, row)
-            conn.execute(
-                "DELETE FROM tasks WHERE chat_id = ? AND seq_num = ?",
-                (chat_id, seq_num)
-            )
-            conn.commit()
-            return task
+            return self._task_from_row(row, assignees)
 
     def update_task_assignees_by_seq(self, chat_id: int, seq_num: int, assignees: list[str]) -> Optional[Task]:
         """Update a task's assignees by sequence number and return the updated task, or None if not found."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT id, chat_id, seq_num, task_id, url, assigned_to, created_by, created_at
-                FROM tasks
-                WHERE chat_id = ? AND seq_num = ?
-                """,
-                (chat_id, seq_num)
-            )
+        conn = self._conn
+        with self._lock, conn:
+            cursor = conn.execute(_SQL_TASK_BY_SEQ, (chat_id, seq_num))
             row = cursor.fetchone()
             
             if row is None:
                 return None
             
-            task_db_id = row["id"]
-            
-            # Update assignees in junction table
-            self._set_task_assignees(conn, task_db_id, assignees)
-            
-            # Update assigned_to for backward compatibility
-            assigned_to = assignees[0] if assignees else "unassigned"
-            conn.execute(
-                "UPDATE tasks SET assigned_to = ? WHERE chat_id = ? AND seq_num = ?",
-                (assigned_to, chat_id, seq_num)
-            )
-            conn.commit()
-            
-            # Return updated task
-            cursor = conn.execute(
-                """
-                SELECT id, chat_id, seq_num, task_id, url, assigned_to, created_by, created_at
-                FROM tasks
-                WHERE chat_id = ? AND seq_num = ?
-                """,
-                (chat_id, seq_num)
-            )
-            row = cursor.fetchone()
-            return self._row_to_task(conn, row)
+            # Update assignees in junction table; the updated Task is
+            # built from the row plus the assignee list already in hand,
+            # with no re-SELECT
+            self._set_task_assignees(conn, row[0], assignees)
+            return self._task_from_row(row, assignees)
 
     def update_task_assignees_by_id(self, chat_id: int, task_id: str, assignees: list[str]) -> Optional[Task]:
         """Update a task's assignees by task_id and return the updated task, or None if not found."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT id, chat_id, seq_num, task_id, url, assigned_to, created_by, created_at
-                FROM tasks
-                WHERE chat_id = ? AND task_id = ?
-                """,
-                (chat_id, task_id)
-            )
+        conn = self._conn
+        with self._lock, conn:
+            cursor = conn.execute(_SQL_TASK_BY_TASK_ID, (chat_id, task_id))
             row = cursor.fetchone()
             
             if row is None:
                 return None
             
-            task_db_id = row["id"]
-            
-            # Update assignees in junction table
-            self._set_task_assignees(conn, task_db_id, assignees)
-            
-            # Update assigned_to for backward compatibility
-            assigned_to = assignees[0] if assignees else "unassigned"
-            conn.execute(
-                "UPDATE tasks SET assigned_to = ? WHERE chat_id = ? AND task_id = ?",
-                (assigned_to, chat_id, task_id)
-            )
-            conn.commit()
-            
-            # Return updated task
-            cursor = conn.execute(
-                """
-                SELECT id, chat_id, seq_num, task_id, url, assigned_to, created_by, created_at
-                FROM tasks
-                WHERE chat_id = ? AND task_id = ?
-                """,
-                (chat_id, task_id)
-            )
-            row = cursor.fetchone()
-            return self._row_to_task(conn, row)
+            self._set_task_assignees(conn, row[0], assignees)
+            return self._task_from_row(row, assignees)
 
     def set_reminder(self, chat_id: int, cron_expression: str, enabled: bool = True) -> None:
         """Set or update a reminder configuration for a chat."""
-        with self._get_connection() as conn:
-            conn.execute(
-                """
-                INSERT INTO reminders (chat_id, cron_expression, enabled, created_at, updated_at)
-                VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-                ON CONFLICT(chat_id) DO UPDATE SET
-                    cron_expression = excluded.cron_expression,
-                    enabled = excluded.enabled,
-                    updated_at = CURRENT_TIMESTAMP
-                """,
-                (chat_id, cron_expression, enabled)
-            )
-            conn.commit()
+        conn = self._conn
+        with self._lock, conn:
+            conn.execute(_SQL_UPSERT_REMINDER, (chat_id, cron_expression, enabled))
+        self._invalidate_reminder_cache(chat_id)
 
     def get_reminder(self, chat_id: int) -> Optional[Reminder]:
-        """Get reminder configuration for a chat."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT chat_id, cron_expression, enabled, created_at, updated_at
-                FROM reminders
-                WHERE chat_id = ?
-                """,
-                (chat_id,)
-            )
+        """Get reminder configuration for a chat, cached between writes."""
+        with self._reminder_cache_lock:
+            if chat_id in self._reminder_cache:
+                return self._reminder_cache[chat_id]
+
+        with self._reader() as conn:
+            cursor = conn.execute(_SQL_GET_REMINDER, (chat_id,))
             row = cursor.fetchone()
-            
-            if row is None:
-                return None
-            
-            return Reminder(
-                chat_id=row["chat_id"],
-                cron_expression=row["cron_expression"],
-                enabled=bool(row["enabled"]),
-                created_at=row["created_at"],
-                updated_at=row["updated_at"]
-            )
+
+        reminder = None if row is None else Reminder(
+            chat_id=row["chat_id"],
+            cron_expression=row["cron_expression"],
+            enabled=bool(row["enabled"]),
+            created_at=_from_unix(row["created_at"]),
+            updated_at=_from_unix(row["updated_at"])
+        )
+        with self._reminder_cache_lock:
+            self._reminder_cache[chat_id] = reminder
+        return reminder
 
     def get_all_active_reminders(self) -> list[Reminder]:
-        """Get all enabled reminders."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                """
-                SELECT chat_id, cron_expression, enabled, created_at, updated_at
-                FROM reminders
-                WHERE enabled = 1
-                """
-            )
-            return [
+        """Get all enabled reminders, cached between writes."""
+        with self._reminder_cache_lock:
+            cached = self._active_reminders_cache
+            if cached is not None:
+                return list(cached)
+
+        with self._reader() as conn:
+            cursor = conn.execute(_SQL_GET_ACTIVE_REMINDERS)
+            reminders = [
                 Reminder(
                     chat_id=row["chat_id"],
                     cron_expression=row["cron_expression"],
                     enabled=bool(row["enabled"]),
-                    created_at=row["created_at"],
-                    updated_at=row["updated_at"]
+                    created_at=_from_unix(row["created_at"]),
+                    updated_at=_from_unix(row["updated_at"])
                 )
-                for row in cursor.fetchall()
+                for row in cursor
             ]
+        with self._reminder_cache_lock:
+            self._active_reminders_cache = reminders
+        return list(reminders)
 
     def disable_reminder(self, chat_id: int) -> bool:
         """Disable a reminder without deleting it. Returns True if reminder exists, False otherwise."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "UPDATE reminders SET enabled = 0, updated_at = CURRENT_TIMESTAMP WHERE chat_id = ?",
-                (chat_id,)
-            )
-            conn.commit()
-            return cursor.rowcount > 0
+        conn = self._conn
+        with self._lock, conn:
+            cursor = conn.execute(_SQL_DISABLE_REMINDER, (chat_id,))
+        self._invalidate_reminder_cache(chat_id)
+        return cursor.rowcount > 0
 
     def delete_reminder(self, chat_id: int) -> bool:
         """Delete a reminder configuration. Returns True if reminder existed, False otherwise."""
-        with self._get_connection() as conn:
-            cursor = conn.execute(
-                "DELETE FROM reminders WHERE chat_id = ?",
-                (chat_id,)
-            )
-            conn.commit()
-            return cursor.rowcount > 0
+        conn = self._conn
+        with self._lock, conn:
+            cursor = conn.execute(_SQL_DELETE_REMINDER, (chat_id,))
+        self._invalidate_reminder_cache(chat_id)
+        return cursor.rowcount > 0
@@ -1,89 +1,76 @@
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+import sqlite3
+import time
+from collections import defaultdict
+from functools import lru_cache, partial
+from typing import TYPE_CHECKING, Optional
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from telegram.constants import ParseMode
-from html import escape as html_escape
+from telegram.error import RetryAfter, TelegramError, TimedOut
 
 if TYPE_CHECKING:
     from telegram.ext import Application
-    from database import Database
+    from database import Database, Task
 
 logger = logging.getLogger(__name__)
 
-# Global scheduler instance
-_scheduler: AsyncIOScheduler | None = None
+# Global scheduler instance. Constructing it at import time is cheap
+# and side-effect free (the event loop is only captured by start()),
+# and spares every job-add the get-or-create branch. The job defaults
+# collapse fires missed during downtime into one (coalesce, with a
+# 60s grace window) and stop a slow fan-out from overlapping the next.
+_scheduler = AsyncIOScheduler(
+    job_defaults={"coalesce": True, "misfire_grace_time": 60, "max_instances": 1}
+)
 
+# Chats sharing a cron expression are served by one coalesced job; these
+# maps track group membership (chat -> cron, cron -> chats).
+_chat_cron: dict[int, str] = {}
+_cron_chats: dict[str, set[int]] = {}
 
-def get_scheduler() -> AsyncIOScheduler:
-    """Get or create the global scheduler instance."""
-    global _scheduler
-    if _scheduler is None:
-        _scheduler = AsyncIOScheduler()
-    return _scheduler
+# Telegram allows ~30 messages/s globally; fan out in waves below that.
+_BATCH_SIZE = 25
+_BATCH_PAUSE = 1.0
 
+# One partial shared by every job binds the process-wide Application
+# and Database once, so each stored job carries only its cron key
+# instead of repeating references to the same two objects.
+_batch_send: Optional[partial] = None
 
-async def send_reminder(chat_id: int, application: "Application", db: "Database") -> None:
-    """Send a reminder message with pending tasks to a chat."""
-    try:
-        tasks = db.get_tasks(chat_id)
-        
-        # Only send if there are pending tasks
-        if not tasks:
-            logger.info(f"No pending tasks for chat {chat_id}, skipping reminder")
-            return
-        
-        # Format message similar to handle_w()
-        lines = ["<b>📋 Reminder: Pending Reviews</b>\n"]
-        for t in tasks:
-            if t.assignees:
-                assignees_formatted = ", ".join(html_escape(a) for a in t.assignees)
-                lines.append(
-                    f'[#{t.seq_num}] <a href="{html_escape(t.url)}">{html_escape(t.task_id)}</a> → '
-                    f'{assignees_formatted} (by {html_escape(t.created_by)})'
-                )
-            else:
-                lines.append(
-                    f'[#{t.seq_num}] <a href="{html_escape(t.url)}">{html_escape(t.task_id)}</a> '
-                    f'(by {html_escape(t.created_by)})'
-                )
-        
-        message = "\n".join(lines)
-        await application.bot.send_message(
-            chat_id=chat_id,
-            text=message,
-            parse_mode=ParseMode.HTML,
-            disable_web_page_preview=True
-        )
-        logger.info(f"Sent reminder to chat {chat_id} with {len(tasks)} task(s)")
-        
-    except Exception as e:
-        logger.error(f"Error sending reminder to chat {chat_id}: {e}", exc_info=True)
+# True while load_existing_reminders is adding jobs in bulk; suppresses
+# the per-add lazy start so the load happens entirely pre-start (or
+# inside one pause/resume window) and setup_scheduler starts once.
+_bulk_loading = False
 
+# Pending-task counts per chat, kept current by the bot handlers via
+# bump_pending; reminder fires for idle chats skip the DB entirely.
+# Seeded from the database in load_existing_reminders.
+_pending_counts: dict[int, int] = {}
 
-def add_reminder_job(
-    chat_id: int,
-    cron_expression: str,
-    application: "Application",
-    db: "Database"
-) -> None:
-    """Add or update a cron job for a chat's reminder."""
-    scheduler = get_scheduler()
-    job_id = f"reminder_{chat_id}"
-    
-    # Remove existing job if present
-    if scheduler.get_job(job_id):
-        scheduler.remove_job(job_id)
-    
-    # Parse cron expression (5-part format: minute hour day month day_of_week)
+
+def bump_pending(chat_id: int, delta: int) -> None:
+    """Adjust a chat's cached pending-task count (clamped at zero)."""
+    _pending_counts[chat_id] = max(0, _pending_counts.get(chat_id, 0) + delta)
+
+
+@lru_cache(maxsize=256)
+def parse_cron_trigger(cron_expression: str) -> CronTrigger:
+    """Parse a 5-part cron expression into a UTC CronTrigger, cached.
+
+    Validation and scheduling share this factory, so an expression is
+    parsed once no matter how often it is re-validated or re-added
+    (users retrying, reminders reloaded on restart).
+
+    Raises ValueError / apscheduler errors on malformed expressions.
+    """
     parts = cron_expression.split()
     if len(parts) != 5:
         raise ValueError("Cron expression must have 5 parts: minute hour day month day_of_week")
-    
+
     minute, hour, day, month, day_of_week = parts
-    
-    # Create cron trigger
-    trigger = CronTrigger(
+    return CronTrigger(
         minute=minute,
         hour=hour,
         day=day,
@@ -91,62 +78,280 @@ def add_reminder_job(
         day_of_week=day_of_week,
         timezone='UTC'
     )
+
+
+class TokenBucket:
+    """Async token bucket; acquire() waits until a token is available."""
+
+    __slots__ = ("_rate", "_capacity", "_tokens", "_updated", "_lock")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+# Telegram caps bots at ~30 msg/s overall and ~20 msg/min per group;
+# every reminder send takes a token from both buckets before hitting
+# the API, so bursts are smoothed instead of bouncing off 429s.
+_global_bucket = TokenBucket(rate=30, capacity=30)
+_chat_buckets: defaultdict[int, TokenBucket] = defaultdict(
+    lambda: TokenBucket(rate=20 / 60, capacity=1)
+)
+
+
+_REMINDER_HEADER = "<b>📋 Reminder: Pending Reviews</b>\n\n"
+
+# %-templates compiled once at module load; applying them avoids the
+# per-iteration f-string bytecode and __format__ dispatch in the loop
+_LINE_ASSIGNED = '[#%d] <a href="%s">%s</a> → %s (by %s)'
+_LINE_UNASSIGNED = '[#%d] <a href="%s">%s</a> (by %s)'
+
+
+def _format_task_line(t: "Task") -> str:
+    """Format one task as an HTML line for the reminder message.
+
+    Uses the *_html fields pre-escaped at Task construction, so
+    rendering does no escaping at all.
+    """
+    if t.assignees:
+        return _LINE_ASSIGNED % (
+            t.seq_num, t.url_html, t.task_id_html, t.assignees_html, t.created_by_html
+        )
+    return _LINE_UNASSIGNED % (
+        t.seq_num, t.url_html, t.task_id_html, t.created_by_html
+    )
+
+
+async def send_reminder(
+    chat_id: int,
+    application: "Application",
+    db: "Database",
+    tasks: Optional[list["Task"]] = None,
+) -> None:
+    """Send a reminder message with pending tasks to a chat.
+
+    tasks may be prefetched by the caller (the fan-out path loads all
+    chats in one db.get_tasks_for_chats query); when omitted, the
+    chat's tasks are fetched here.
+
+    Failures are handled per phase (DB fetch vs Telegram send) so a
+    scheduler-shutdown CancelledError propagates instead of being
+    swallowed by a blanket handler.
+    """
+    if tasks is None:
+        if _pending_counts.get(chat_id, 0) == 0:
+            logger.info("No pending tasks for chat %s, skipping reminder", chat_id)
+            return
+        try:
+            # Off-thread so the sqlite read doesn't block the event loop
+            tasks = await asyncio.to_thread(db.get_tasks, chat_id)
+        except sqlite3.Error as e:
+            logger.error("Failed to load tasks for chat %s: %s", chat_id, e, exc_info=True)
+            return
+    
+    # Only send if there are pending tasks
+    if not tasks:
+        logger.info("No pending tasks for chat %s, skipping reminder", chat_id)
+        return
     
-    # Add job
-    scheduler.add_job(
-        send_reminder,
-        trigger=trigger,
-        args=[chat_id, application, db],
-        id=job_id,
-        name=f"Reminder for chat {chat_id}",
-        replace_existing=True
+    # Format message similar to handle_w()
+    message = _REMINDER_HEADER + "\n".join(_format_task_line(t) for t in tasks)
+    for attempt in range(3):
+        await _global_bucket.acquire()
+        await _chat_buckets[chat_id].acquire()
+        try:
+            await application.bot.send_message(
+                chat_id=chat_id,
+                text=message,
+                parse_mode=ParseMode.HTML,
+                disable_web_page_preview=True
+            )
+        except RetryAfter as e:
+            # Back off exactly as long as Telegram asks, then retry
+            logger.warning(
+                "Rate limited sending reminder to chat %s; retrying in %ss",
+                chat_id, e.retry_after
+            )
+            await asyncio.sleep(e.retry_after + 0.5)
+        except TimedOut:
+            await asyncio.sleep(1)
+        except TelegramError as e:
+            logger.error("Error sending reminder to chat %s: %s", chat_id, e, exc_info=True)
+            return
+        else:
+            break
+    else:
+        logger.error("Dropping reminder for chat %s after %s attempts", chat_id, attempt + 1)
+        return
+    logger.info("Sent reminder to chat %s with %s task(s)", chat_id, len(tasks))
+
+
+async def send_reminders_batch(
+    cron_expression: str,
+    application: "Application",
+    db: "Database"
+) -> None:
+    """Fan out reminders to every chat sharing one cron schedule.
+
+    All chats' tasks are prefetched in a single query, then sends run
+    concurrently in waves of _BATCH_SIZE with a pause between waves so
+    a large fan-out stays under Telegram's global rate limit.
+    """
+    chats = sorted(
+        c for c in _cron_chats.get(cron_expression, ())
+        if _pending_counts.get(c, 0)
     )
+    if not chats:
+        return
+
+    # Off-thread so the sqlite read doesn't block the event loop
+    tasks_by_chat = await asyncio.to_thread(db.get_tasks_for_chats, chats)
+    for start in range(0, len(chats), _BATCH_SIZE):
+        wave = chats[start:start + _BATCH_SIZE]
+        await asyncio.gather(
+            *(send_reminder(c, application, db, tasks_by_chat[c]) for c in wave)
+        )
+        if start + _BATCH_SIZE < len(chats):
+            await asyncio.sleep(_BATCH_PAUSE)
+
+
+def _drop_chat_from_group(cron_expression: str, chat_id: int) -> None:
+    """Remove a chat from its cron group, dropping the job if it empties."""
+    chats = _cron_chats.get(cron_expression)
+    if chats is None:
+        return
+    chats.discard(chat_id)
+    if not chats:
+        del _cron_chats[cron_expression]
+        job_id = f"reminder_cron_{cron_expression}"
+        if _scheduler.get_job(job_id):
+            _scheduler.remove_job(job_id)
+
+
+def add_reminder_job(
+    chat_id: int,
+    cron_expression: str,
+    application: "Application",
+    db: "Database"
+) -> None:
+    """Add or update a chat's reminder, coalescing by cron expression.
+
+    Chats on the same schedule share one scheduler job that fires
+    send_reminders_batch for the whole group.
+    """
+    global _batch_send
+    if _batch_send is None:
+        _batch_send = partial(send_reminders_batch, application=application, db=db)
+
+    # Parse cron expression (5-part format: minute hour day month day_of_week)
+    # before touching group state, so invalid input changes nothing.
+    trigger = parse_cron_trigger(cron_expression)
+
+    # Move the chat out of its previous group, if the schedule changed
+    old_cron = _chat_cron.get(chat_id)
+    if old_cron is not None and old_cron != cron_expression:
+        _drop_chat_from_group(old_cron, chat_id)
+
+    # _cron_chats mirrors the jobstore, so group membership tells us
+    # whether the job exists without a get_job probe (jobstore lock)
+    group_exists = cron_expression in _cron_chats
+    _chat_cron[chat_id] = cron_expression
+    _cron_chats.setdefault(cron_expression, set()).add(chat_id)
+
+    if not group_exists:
+        _scheduler.add_job(
+            _batch_send,
+            trigger=trigger,
+            args=[cron_expression],
+            id=f"reminder_cron_{cron_expression}",
+            name=f"Reminders for cron '{cron_expression}'",
+            replace_existing=True
+        )
+
+    # Lazy start: the scheduler only begins ticking once a job exists.
+    # Skipped during bulk load, where setup_scheduler starts it once at
+    # the end instead of on the first reminder of the batch.
+    if not _bulk_loading and not _scheduler.running:
+        _scheduler.start()
+        logger.info("Scheduler started")
     
-    logger.info(f"Added reminder job for chat {chat_id}: {cron_expression}")
+    logger.info("Added reminder job for chat %s: %s", chat_id, cron_expression)
 
 
 def remove_reminder_job(chat_id: int) -> None:
-    """Remove a cron job for a chat's reminder."""
-    scheduler = get_scheduler()
-    job_id = f"reminder_{chat_id}"
-    
-    if scheduler.get_job(job_id):
-        scheduler.remove_job(job_id)
-        logger.info(f"Removed reminder job for chat {chat_id}")
+    """Remove a chat's reminder from its cron group."""
+    cron_expression = _chat_cron.pop(chat_id, None)
+    if cron_expression is None:
+        return
+    _drop_chat_from_group(cron_expression, chat_id)
+    logger.info("Removed reminder job for chat %s", chat_id)
 
 
 def load_existing_reminders(application: "Application", db: "Database") -> None:
     """Load all active reminders from database and schedule them."""
+    _pending_counts.update(db.get_pending_counts())
     reminders = db.get_all_active_reminders()
+
+    # Before start() there is nothing to pause; on a live scheduler,
+    # pausing collapses one wakeup recompute per add into a single
+    # recompute on resume.
+    global _bulk_loading
+    paused = _scheduler.running
+    if paused:
+        _scheduler.pause()
+    _bulk_loading = True
+    try:
+        for reminder in reminders:
+            try:
+                add_reminder_job(
+                    reminder.chat_id,
+                    reminder.cron_expression,
+                    application,
+                    db
+                )
+                logger.info("Loaded reminder for chat %s: %s", reminder.chat_id, reminder.cron_expression)
+            except Exception as e:
+                logger.error(
+                    "Failed to load reminder for chat %s: %s",
+                    reminder.chat_id, e,
+                    exc_info=True
+                )
+    finally:
+        _bulk_loading = False
+        if paused:
+            _scheduler.resume()
     
-    for reminder in reminders:
-        try:
-            add_reminder_job(
-                reminder.chat_id,
-                reminder.cron_expression,
-                application,
-                db
-            )
-            logger.info(f"Loaded reminder for chat {reminder.chat_id}: {reminder.cron_expression}")
-        except Exception as e:
-            logger.error(
-                f"Failed to load reminder for chat {reminder.chat_id}: {e}",
-                exc_info=True
-            )
-    
-    logger.info(f"Loaded {len(reminders)} active reminder(s)")
+    logger.info("Loaded %s active reminder(s)", len(reminders))
 
 
 def setup_scheduler(application: "Application", db: "Database") -> AsyncIOScheduler:
-    """Initialize and start the scheduler with existing reminders."""
-    scheduler = get_scheduler()
-    
+    """Initialize the scheduler with existing reminders.
+
+    The scheduler is only started when it actually has jobs; installs
+    with no reminders configured skip the background heartbeat entirely
+    and add_reminder_job starts it on the first add.
+    """
     # Load existing reminders from database
     load_existing_reminders(application, db)
     
-    # Start the scheduler if not already running
-    if not scheduler.running:
-        scheduler.start()
+    if _scheduler.get_jobs() and not _scheduler.running:
+        _scheduler.start()
         logger.info("Scheduler started")
     
-    return scheduler
+    return _scheduler